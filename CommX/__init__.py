@@ -1,15 +1,23 @@
-from .signals import sine_wave, square_wave, chirp, random_binary_sequence, text_to_binary
-from .modulation import bpsk_modulate, bpsk_demodulate, qpsk_modulate, qpsk_demodulate
-from .channels import awgn
+from .signals import (sine_wave, square_wave, chirp, random_binary_sequence, text_to_binary, binary_to_text,
+                      bytes_to_binary, binary_to_bytes, read_iq, write_iq)
+from .modulation import (bpsk_modulate, bpsk_demodulate, qpsk_modulate, qpsk_demodulate,
+                         bpsk_modulate_baseband, bpsk_demodulate_baseband,
+                         qpsk_modulate_baseband, qpsk_demodulate_baseband)
+from .channels import awgn, block_fading, BlockFadingChannel, tapped_delay_line, MultipathChannel, multipath
 from .error_correction import hamming_encode, hamming_decode
-from .visualization import plot_time_domain, plot_frequency_domain, plot_constellation
+from .visualization import plot_time_domain, plot_frequency_domain, plot_constellation, welch_psd
 from .metrics import calculate_ber
-from .simulation import CommunicationSystem
+from .synchronization import BARKER_13, fft_correlate, find_preamble, align_payload, FrameSynchronizer
+from .simulation import CommunicationSystem, ber_sweep
 
 __all__ = [
-    'sine_wave', 'square_wave', 'chirp', 'random_binary_sequence', 'text_to_binary',
+    'sine_wave', 'square_wave', 'chirp', 'random_binary_sequence', 'text_to_binary', 'binary_to_text',
+    'bytes_to_binary', 'binary_to_bytes', 'read_iq', 'write_iq',
     'bpsk_modulate', 'bpsk_demodulate', 'qpsk_modulate', 'qpsk_demodulate',
-    'awgn', 'hamming_encode', 'hamming_decode',
-    'plot_time_domain', 'plot_frequency_domain', 'plot_constellation',
-    'calculate_ber', 'CommunicationSystem'
+    'bpsk_modulate_baseband', 'bpsk_demodulate_baseband', 'qpsk_modulate_baseband', 'qpsk_demodulate_baseband',
+    'awgn', 'block_fading', 'BlockFadingChannel', 'tapped_delay_line', 'MultipathChannel', 'multipath',
+    'hamming_encode', 'hamming_decode',
+    'plot_time_domain', 'plot_frequency_domain', 'plot_constellation', 'welch_psd',
+    'BARKER_13', 'fft_correlate', 'find_preamble', 'align_payload', 'FrameSynchronizer',
+    'calculate_ber', 'CommunicationSystem', 'ber_sweep'
 ]
\ No newline at end of file
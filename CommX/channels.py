@@ -1,16 +1,192 @@
 import numpy as np
 
-def awgn(signal: np.ndarray, snr_db: float) -> np.ndarray:
-    if np.iscomplexobj(signal):
-        noise_real = np.random.normal(0, 1, signal.shape)
-        noise_imag = np.random.normal(0, 1, signal.shape)
-        noise = noise_real + 1j * noise_imag
-        signal_power = np.mean(np.abs(signal) ** 2)
-        noise_power = signal_power / (10 ** (snr_db / 10))
-        noise *= np.sqrt(noise_power / 2)
+_NOISE_CHUNK = 1 << 16
+
+def _real_dtype(signal: np.ndarray):
+    return np.float32 if signal.dtype in (np.float32, np.complex64) else np.float64
+
+def _output_buffer(signal: np.ndarray, out: np.ndarray) -> np.ndarray:
+    if out is None:
+        dtype = _real_dtype(signal)
+        if np.iscomplexobj(signal):
+            dtype = np.result_type(dtype, np.complex64)
+        return np.empty(signal.shape, dtype=dtype)
+    if out.shape != signal.shape:
+        raise ValueError("out must have the same shape as signal.")
+    if not out.flags.c_contiguous:
+        raise ValueError("out must be C-contiguous.")
+    return out
+
+def _add_noise(signal: np.ndarray, sigma: float, rng: np.random.Generator, out: np.ndarray) -> np.ndarray:
+    # Noise is drawn and added one cache-sized chunk at a time, so no full-length
+    # noise array is ever allocated and out may alias signal.
+    src = np.ascontiguousarray(signal).reshape(-1)
+    dst = out.reshape(-1)
+    dtype = _real_dtype(out)
+    complex_out = np.iscomplexobj(out)
+    for start in range(0, src.size, _NOISE_CHUNK):
+        stop = min(start + _NOISE_CHUNK, src.size)
+        if complex_out:
+            noise = rng.standard_normal(2 * (stop - start), dtype=dtype).view(out.dtype)
+        else:
+            noise = rng.standard_normal(stop - start, dtype=dtype)
+        noise *= sigma
+        np.add(src[start:stop], noise, out=dst[start:stop], casting='unsafe')
+    return out
+
+def _add_legacy_noise(signal: np.ndarray, sigma: float, out: np.ndarray) -> np.ndarray:
+    # Chunked draws from the global np.random state, all real parts first and
+    # then all imaginary parts, which is the same stream as one
+    # np.random.normal call per component.
+    src = np.ascontiguousarray(signal).reshape(-1)
+    dst = out.reshape(-1)
+    if np.iscomplexobj(src) and np.iscomplexobj(dst):
+        parts = [(src.real, dst.real), (src.imag, dst.imag)]
     else:
-        noise = np.random.normal(0, 1, signal.shape)
-        signal_power = np.mean(signal ** 2)
-        noise_power = signal_power / (10 ** (snr_db / 10))
-        noise *= np.sqrt(noise_power)
-    return signal + noise
\ No newline at end of file
+        parts = [(src, dst)]
+    for part_src, part_dst in parts:
+        for start in range(0, src.size, _NOISE_CHUNK):
+            stop = min(start + _NOISE_CHUNK, src.size)
+            noise = np.random.normal(0, 1, stop - start)
+            noise *= sigma
+            np.add(part_src[start:stop], noise, out=part_dst[start:stop], casting='unsafe')
+    return out
+
+def _signal_power(signal: np.ndarray) -> float:
+    # Accumulated in float64 one chunk at a time: a float32 dot product over
+    # the whole signal drifts by percent-level errors on long inputs.
+    flat = np.ascontiguousarray(signal).reshape(-1)
+    wide = np.complex128 if np.iscomplexobj(flat) else np.float64
+    total = 0.0
+    for start in range(0, flat.size, _NOISE_CHUNK):
+        chunk = flat[start:start + _NOISE_CHUNK].astype(wide, copy=False)
+        total += np.vdot(chunk, chunk).real
+    return total / flat.size
+
+def awgn(signal: np.ndarray, snr_db: float, rng: np.random.Generator = None,
+         out: np.ndarray = None) -> np.ndarray:
+    signal = np.asarray(signal)
+    signal_power = _signal_power(signal)
+    noise_power = signal_power / (10 ** (snr_db / 10))
+    out = _output_buffer(signal, out)
+    sigma = np.sqrt(noise_power / 2) if np.iscomplexobj(out) else np.sqrt(noise_power)
+    if rng is None:
+        return _add_legacy_noise(signal, sigma, out)
+    return _add_noise(signal, sigma, rng, out)
+
+def _normal(rng: np.random.Generator, size) -> np.ndarray:
+    # Like awgn, fall back to the global np.random state when no generator is given.
+    return np.random.standard_normal(size) if rng is None else rng.standard_normal(size)
+
+def _fading_gains(shape: tuple, k_factor: float, rng: np.random.Generator) -> np.ndarray:
+    # Draws are laid out per block, so the gain sequence does not depend on
+    # how many blocks are drawn at a time.
+    los = np.sqrt(k_factor / (k_factor + 1))
+    scatter = np.sqrt(1 / (2 * (k_factor + 1)))
+    draws = _normal(rng, shape + (2,))
+    return los + scatter * (draws[..., 0] + 1j * draws[..., 1])
+
+def _apply_gains(signal: np.ndarray, gains: np.ndarray) -> tuple:
+    # Complex signals get the complex gain, real passband signals its envelope only.
+    if not np.iscomplexobj(signal):
+        gains = np.abs(gains)
+    if _real_dtype(signal) == np.float32:
+        gains = gains.astype(np.complex64 if np.iscomplexobj(gains) else np.float32)
+    return gains
+
+def block_fading(signal: np.ndarray, block_length: int, rng: np.random.Generator = None,
+                 k_factor: float = 0.0, return_gains: bool = False):
+    # Rayleigh (k_factor = 0) or Rician gain held constant over each block of samples.
+    signal = np.asarray(signal)
+    num_blocks = -(-signal.shape[-1] // block_length)
+    gains = _apply_gains(signal, _fading_gains(signal.shape[:-1] + (num_blocks,), k_factor, rng))
+    faded = signal * np.repeat(gains, block_length, axis=-1)[..., :signal.shape[-1]]
+    if return_gains:
+        return faded, gains
+    return faded
+
+class BlockFadingChannel:
+    def __init__(self, block_length: int, rng: np.random.Generator = None, k_factor: float = 0.0):
+        if block_length < 1:
+            raise ValueError("block_length must be a positive number of samples.")
+        self.block_length = block_length
+        self.rng = rng
+        self.k_factor = k_factor
+        self.reset()
+
+    def reset(self) -> None:
+        self._gain = None
+        self._remaining = 0
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        # The gain of a block that straddles a chunk boundary is carried over,
+        # so consecutive chunks fade exactly like one call to block_fading.
+        chunk = np.asarray(chunk)
+        carried = min(self._remaining, len(chunk))
+        num_blocks = -(-(len(chunk) - carried) // self.block_length)
+        gains = _fading_gains((num_blocks,), self.k_factor, self.rng)
+        counts = np.full(num_blocks, self.block_length)
+        if carried:
+            gains = np.concatenate(([self._gain], gains))
+            counts = np.concatenate(([carried], counts))
+        if len(gains):
+            self._gain = gains[-1]
+        self._remaining += num_blocks * self.block_length - len(chunk)
+        return chunk * np.repeat(_apply_gains(chunk, gains), counts)[:len(chunk)]
+
+def tapped_delay_line(delays, powers_db, rng: np.random.Generator = None) -> np.ndarray:
+    # One Rayleigh realization of a power-delay profile given in integer sample delays.
+    delays = np.asarray(delays, dtype=int)
+    powers = 10 ** (np.asarray(powers_db, dtype=float) / 10)
+    taps = np.zeros(delays.max() + 1, dtype=complex)
+    gains = np.sqrt(powers / 2) * (_normal(rng, len(delays)) + 1j * _normal(rng, len(delays)))
+    np.add.at(taps, delays, gains)
+    return taps
+
+class MultipathChannel:
+    def __init__(self, taps: np.ndarray, fft_size: int = None):
+        self.taps = np.asarray(taps)
+        if self.taps.ndim != 1 or len(self.taps) == 0:
+            raise ValueError("taps must be a non-empty 1-D array.")
+        overlap = len(self.taps) - 1
+        if fft_size is None:
+            fft_size = 1 << max(8, int(np.ceil(np.log2(8 * len(self.taps)))))
+        if fft_size <= overlap:
+            raise ValueError("fft_size must be longer than the channel impulse response.")
+        self.fft_size = fft_size
+        self.overlap = overlap
+        self.step = fft_size - overlap
+        self._spectra = {}
+        self.reset()
+
+    def reset(self) -> None:
+        self._history = np.zeros(self.overlap, dtype=self.taps.dtype)
+
+    def _spectrum(self, real: bool) -> np.ndarray:
+        if real not in self._spectra:
+            fft = np.fft.rfft if real else np.fft.fft
+            self._spectra[real] = fft(self.taps, self.fft_size)
+        return self._spectra[real]
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        # Overlap-save: each FFT block re-reads the previous `overlap` inputs,
+        # so consecutive chunks filter exactly like one long convolution.
+        chunk = np.asarray(chunk)
+        dtype = np.result_type(chunk, self.taps, np.float32)
+        if len(chunk) == 0:
+            return np.zeros(0, dtype=dtype)
+        buffer = np.concatenate((self._history.astype(dtype, copy=False), chunk))
+        self._history = buffer[len(buffer) - self.overlap:].copy()
+        num_blocks = -(-len(chunk) // self.step)
+        padded = np.zeros(num_blocks * self.step + self.overlap, dtype=dtype)
+        padded[:len(buffer)] = buffer
+        blocks = np.lib.stride_tricks.sliding_window_view(padded, self.fft_size)[::self.step]
+        real = not np.iscomplexobj(padded)
+        if real:
+            filtered = np.fft.irfft(np.fft.rfft(blocks, axis=-1) * self._spectrum(True), self.fft_size, axis=-1)
+        else:
+            filtered = np.fft.ifft(np.fft.fft(blocks, axis=-1) * self._spectrum(False), axis=-1)
+        return filtered[:, self.overlap:].reshape(-1)[:len(chunk)].astype(dtype, copy=False)
+
+def multipath(signal: np.ndarray, taps: np.ndarray, fft_size: int = None) -> np.ndarray:
+    return MultipathChannel(taps, fft_size).process(signal)
@@ -1,31 +1,72 @@
 import numpy as np
+from functools import lru_cache
 
-def hamming_encode(data: np.ndarray) -> np.ndarray:
-    if len(data) % 4 != 0:
-        raise ValueError("Data length must be a multiple of 4.")
-    G = np.array([[1, 0, 0, 0, 1, 1, 0],
-                  [0, 1, 0, 0, 1, 0, 1],
-                  [0, 0, 1, 0, 0, 1, 1],
-                  [0, 0, 0, 1, 1, 1, 1]], dtype=int)
-    encoded = []
-    for i in range(0, len(data), 4):
-        block = data[i:i + 4]
-        encoded_block = (block @ G) % 2
-        encoded.extend(encoded_block)
-    return np.array(encoded)
+@lru_cache(maxsize=16)
+def _hamming_code(m: int) -> tuple:
+    # Systematic Hamming(2^m - 1, 2^m - 1 - m): G = [I | P], H = [P^T | I].
+    # Parity rows are the m-bit patterns of weight >= 2, which for m = 3
+    # reproduces the classic (7, 4) generator.
+    if m < 2:
+        raise ValueError("Hamming order m must be at least 2.")
+    patterns = [[(v >> (m - 1 - j)) & 1 for j in range(m)] for v in range(1, 2 ** m)]
+    parity_rows = sorted((p for p in patterns if sum(p) >= 2), key=lambda p: (sum(p), [-b for b in p]))
+    P = np.array(parity_rows, dtype=np.uint8)
+    k = P.shape[0]
+    G = np.hstack((np.eye(k, dtype=np.uint8), P))
+    H = np.hstack((P.T, np.eye(m, dtype=np.uint8)))
+    weights = 2 ** np.arange(m - 1, -1, -1)
+    table = np.full(2 ** m, -1, dtype=np.intp)
+    table[weights @ H] = np.arange(H.shape[1])
+    for array in (G, H, weights, table):
+        array.setflags(write=False)
+    return G, H, weights, table
 
-def hamming_decode(received: np.ndarray) -> np.ndarray:
-    if len(received) % 7 != 0:
-        raise ValueError("Received data length must be a multiple of 7.")
-    H = np.array([[1, 0, 1, 0, 1, 0, 1],
-                  [0, 1, 1, 0, 0, 1, 1],
-                  [0, 0, 0, 1, 1, 1, 1]], dtype=int)
-    decoded = []
-    for i in range(0, len(received), 7):
-        block = received[i:i + 7]
-        syndrome = (H @ block) % 2
-        error_pos = int(''.join(map(str, syndrome)), 2)
-        if error_pos != 0:
-            block[error_pos - 1] ^= 1
-        decoded.extend(block[:4])
-    return np.array(decoded)
\ No newline at end of file
+def _to_bits(data: np.ndarray, packed: bool) -> np.ndarray:
+    data = np.asarray(data)
+    if packed:
+        return np.unpackbits(data.astype(np.uint8, copy=False))
+    return data
+
+def _from_bits(bits: np.ndarray, packed: bool) -> np.ndarray:
+    bits = bits.astype(np.uint8, copy=False)
+    return np.packbits(bits) if packed else bits
+
+def hamming_encode(data: np.ndarray, m: int = 3, extended: bool = False, packed: bool = False) -> np.ndarray:
+    G, _, _, _ = _hamming_code(m)
+    k = G.shape[0]
+    bits = _to_bits(data, packed)
+    if len(bits) % k != 0:
+        raise ValueError(f"Data length must be a multiple of {k}.")
+    blocks = bits.reshape(-1, k).astype(np.uint8, copy=False)
+    encoded = (blocks @ G) & 1
+    if extended:
+        encoded = np.hstack((encoded, encoded.sum(axis=1, dtype=np.uint8)[:, None] & 1))
+    return _from_bits(encoded.ravel(), packed)
+
+def hamming_decode(received: np.ndarray, m: int = 3, extended: bool = False, packed: bool = False,
+                   return_status: bool = False):
+    G, H, weights, table = _hamming_code(m)
+    k, n = G.shape
+    block_length = n + 1 if extended else n
+    bits = _to_bits(received, packed)
+    if packed:
+        bits = bits[:len(bits) - len(bits) % block_length]
+    if len(bits) % block_length != 0:
+        raise ValueError(f"Received data length must be a multiple of {block_length}.")
+    blocks = bits.reshape(-1, block_length).astype(np.uint8, copy=False)
+    syndrome = ((blocks[:, :n] @ H.T) & 1) @ weights
+    error_pos = table[syndrome]
+    # status per block: 0 no error, 1 corrected, 2 detected but uncorrectable
+    status = (syndrome != 0).astype(np.uint8)
+    if extended:
+        parity_error = (blocks.sum(axis=1) & 1).astype(bool)
+        status[parity_error] = 1
+        status[~parity_error & (syndrome != 0)] = 2
+        error_pos[~parity_error] = -1
+    data = blocks[:, :k].copy()
+    rows = np.nonzero((error_pos >= 0) & (error_pos < k))[0]
+    data[rows, error_pos[rows]] ^= 1
+    decoded = _from_bits(data.ravel(), packed)
+    if return_status:
+        return decoded, status
+    return decoded
@@ -1,7 +1,21 @@
 import numpy as np
 
-def calculate_ber(original: np.ndarray, received: np.ndarray) -> float:
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+def calculate_ber(original: np.ndarray, received: np.ndarray, packed: bool = False,
+                  num_bits: int = None) -> float:
     if len(original) != len(received):
         raise ValueError("Original and received sequences must have the same length.")
-    errors = np.sum(original != received)
-    return errors / len(original)
\ No newline at end of file
+    if packed:
+        # num_bits excludes the zero padding np.packbits adds to the last byte.
+        if num_bits is None:
+            num_bits = 8 * len(original)
+        if not 8 * len(original) - 8 < num_bits <= 8 * len(original):
+            raise ValueError("num_bits must fall within the last packed byte.")
+        diff = np.bitwise_xor(original, received)
+        if num_bits < 8 * len(original):
+            diff[-1] &= (0xFF << (8 * len(original) - num_bits)) & 0xFF
+        errors = int(_POPCOUNT[diff].sum(dtype=np.int64))
+        return errors / num_bits
+    errors = np.count_nonzero(original != received)
+    return errors / len(original)
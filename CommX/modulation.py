@@ -1,56 +1,141 @@
 import numpy as np
+from functools import lru_cache
 
-def bpsk_modulate(binary_sequence: np.ndarray, carrier_freq: float, sample_rate: float, bit_duration: float) -> np.ndarray:
-    t = np.arange(0, len(binary_sequence) * bit_duration, 1 / sample_rate)
-    carrier = np.sin(2 * np.pi * carrier_freq * t)
-    modulated = np.zeros_like(t)
-    for i, bit in enumerate(binary_sequence):
-        start = int(i * bit_duration * sample_rate)
-        end = int((i + 1) * bit_duration * sample_rate)
-        modulated[start:end] = carrier[start:end] if bit == 1 else -carrier[start:end]
-    return modulated
-
-def bpsk_demodulate(received_signal: np.ndarray, carrier_freq: float, sample_rate: float, bit_duration: float) -> np.ndarray:
-    num_bits = int(len(received_signal) / (sample_rate * bit_duration))
-    demodulated = np.zeros(num_bits, dtype=int)
-    t = np.arange(0, bit_duration, 1 / sample_rate)
-    carrier = np.sin(2 * np.pi * carrier_freq * t)
-    for i in range(num_bits):
-        start = int(i * bit_duration * sample_rate)
-        end = int((i + 1) * bit_duration * sample_rate)
-        correlation = np.sum(received_signal[start:end] * carrier[:end - start])
-        demodulated[i] = 1 if correlation > 0 else 0
-    return demodulated
-
-def qpsk_modulate(binary_sequence: np.ndarray, carrier_freq: float, sample_rate: float, bit_duration: float) -> np.ndarray:
-    if len(binary_sequence) % 2 != 0:
+_QPSK_PHASES = np.array([np.pi / 4, 3 * np.pi / 4, -np.pi / 4, -3 * np.pi / 4])
+_QPSK_I = np.cos(_QPSK_PHASES)
+_QPSK_Q = np.sin(_QPSK_PHASES)
+
+def _samples_per_symbol(sample_rate: float, bit_duration: float) -> int:
+    sps = sample_rate * bit_duration
+    n = int(round(sps))
+    if n < 1 or not np.isclose(sps, n):
+        raise ValueError("sample_rate * bit_duration must be a positive whole number of samples.")
+    return n
+
+def _sample_dtype(dtype) -> type:
+    if np.dtype(dtype) in (np.float32, np.complex64):
+        return np.float32
+    return np.float64
+
+@lru_cache(maxsize=64)
+def _carrier_templates(carrier_freq: float, sample_rate: float, bit_duration: float, dtype=np.float64) -> tuple:
+    # One symbol of sin/cos carrier plus the carrier phase advance per symbol
+    # (zero when every symbol spans a whole number of carrier cycles).
+    sps = _samples_per_symbol(sample_rate, bit_duration)
+    t = np.arange(sps) * (1 / sample_rate)
+    sin_t = np.sin(2 * np.pi * carrier_freq * t).astype(dtype)
+    cos_t = np.cos(2 * np.pi * carrier_freq * t).astype(dtype)
+    sin_t.setflags(write=False)
+    cos_t.setflags(write=False)
+    cycles = carrier_freq * sps / sample_rate
+    frac = cycles - round(cycles)
+    step = 0.0 if np.isclose(frac, 0, atol=1e-9) else 2 * np.pi * frac
+    return sin_t, cos_t, step
+
+def _carrier_rows(num_symbols: int, carrier_freq: float, sample_rate: float, bit_duration: float,
+                  dtype=np.float64, first_symbol: int = 0) -> tuple:
+    # Continuous-phase carrier laid out as a (symbols x samples-per-symbol) matrix,
+    # starting at symbol first_symbol of the stream.
+    sin_t, cos_t, step = _carrier_templates(carrier_freq, sample_rate, bit_duration, dtype)
+    if step == 0.0:
+        return sin_t, cos_t
+    phi = step * (first_symbol + np.arange(num_symbols))
+    c = np.cos(phi).astype(dtype)[:, None]
+    s = np.sin(phi).astype(dtype)[:, None]
+    return c * sin_t + s * cos_t, c * cos_t - s * sin_t
+
+def _symbol_matrix(received_signal: np.ndarray, sample_rate: float, bit_duration: float) -> np.ndarray:
+    signal = np.asarray(received_signal)
+    sps = _samples_per_symbol(sample_rate, bit_duration)
+    num_symbols = signal.shape[-1] // sps
+    return signal[..., :num_symbols * sps].reshape(signal.shape[:-1] + (num_symbols, sps))
+
+def _qpsk_index(bits: np.ndarray) -> np.ndarray:
+    # Constellation index of each bit pair, kept in uint8 rather than widened.
+    pairs = bits.reshape(bits.shape[:-1] + (-1, 2)).astype(np.uint8, copy=False)
+    return (pairs[..., 0] << 1) | pairs[..., 1]
+
+def _correlate(frames: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    # Per-symbol correlation against the same carrier rows the modulator used.
+    if rows.ndim == 1:
+        return frames @ rows
+    return np.einsum('...ij,ij->...i', frames, rows)
+
+def bpsk_modulate(binary_sequence: np.ndarray, carrier_freq: float, sample_rate: float, bit_duration: float,
+                  dtype=np.float64, first_symbol: int = 0) -> np.ndarray:
+    bits = np.asarray(binary_sequence)
+    dtype = _sample_dtype(dtype)
+    sin_rows, _ = _carrier_rows(bits.shape[-1], carrier_freq, sample_rate, bit_duration, dtype, first_symbol)
+    symbols = np.where(bits == 1, dtype(1), dtype(-1))
+    modulated = symbols[..., None] * sin_rows
+    return modulated.reshape(bits.shape[:-1] + (-1,))
+
+def bpsk_demodulate(received_signal: np.ndarray, carrier_freq: float, sample_rate: float, bit_duration: float,
+                    first_symbol: int = 0) -> np.ndarray:
+    frames = _symbol_matrix(received_signal, sample_rate, bit_duration)
+    sin_rows, _ = _carrier_rows(frames.shape[-2], carrier_freq, sample_rate, bit_duration,
+                                _sample_dtype(frames.dtype), first_symbol)
+    correlation = _correlate(frames, sin_rows)
+    return (correlation > 0).astype(np.uint8)
+
+def qpsk_modulate(binary_sequence: np.ndarray, carrier_freq: float, sample_rate: float, bit_duration: float,
+                  dtype=np.float64, first_symbol: int = 0) -> np.ndarray:
+    bits = np.asarray(binary_sequence)
+    dtype = _sample_dtype(dtype)
+    if bits.shape[-1] % 2 != 0:
         raise ValueError("Binary sequence length must be even for QPSK.")
-    symbols = [(binary_sequence[i], binary_sequence[i + 1]) for i in range(0, len(binary_sequence), 2)]
-    t = np.arange(0, len(symbols) * bit_duration, 1 / sample_rate)
-    carrier_i = np.sin(2 * np.pi * carrier_freq * t)
-    carrier_q = np.cos(2 * np.pi * carrier_freq * t)
-    modulated = np.zeros_like(t, dtype=float)
-    for i, (b1, b2) in enumerate(symbols):
-        start = int(i * bit_duration * sample_rate)
-        end = int((i + 1) * bit_duration * sample_rate)
-        phase = {(0, 0): np.pi / 4, (0, 1): 3 * np.pi / 4, (1, 0): -np.pi / 4, (1, 1): -3 * np.pi / 4}
-        theta = phase[(b1, b2)]
-        modulated[start:end] = carrier_i[start:end] * np.cos(theta) + carrier_q[start:end] * np.sin(theta)
-    return modulated
-
-def qpsk_demodulate(received_signal: np.ndarray, carrier_freq: float, sample_rate: float, bit_duration: float) -> np.ndarray:
-    num_symbols = int(len(received_signal) / (sample_rate * bit_duration))
-    demodulated = np.zeros(num_symbols * 2, dtype=int)
-    t = np.arange(0, bit_duration, 1 / sample_rate)
-    carrier_i = np.sin(2 * np.pi * carrier_freq * t)
-    carrier_q = np.cos(2 * np.pi * carrier_freq * t)
-    for i in range(num_symbols):
-        start = int(i * bit_duration * sample_rate)
-        end = int((i + 1) * bit_duration * sample_rate)
-        i_component = np.sum(received_signal[start:end] * carrier_i[:end - start])
-        q_component = np.sum(received_signal[start:end] * carrier_q[:end - start])
-        b1 = 1 if i_component < 0 else 0
-        b2 = 1 if q_component < 0 else 0
-        demodulated[2 * i] = b1
-        demodulated[2 * i + 1] = b2
-    return demodulated
\ No newline at end of file
+    index = _qpsk_index(bits)
+    sin_rows, cos_rows = _carrier_rows(index.shape[-1], carrier_freq, sample_rate, bit_duration, dtype,
+                                       first_symbol)
+    i_amplitude = _QPSK_I.astype(dtype)[index][..., None]
+    q_amplitude = _QPSK_Q.astype(dtype)[index][..., None]
+    modulated = i_amplitude * sin_rows + q_amplitude * cos_rows
+    return modulated.reshape(bits.shape[:-1] + (-1,))
+
+def qpsk_demodulate(received_signal: np.ndarray, carrier_freq: float, sample_rate: float, bit_duration: float,
+                    first_symbol: int = 0) -> np.ndarray:
+    frames = _symbol_matrix(received_signal, sample_rate, bit_duration)
+    sin_rows, cos_rows = _carrier_rows(frames.shape[-2], carrier_freq, sample_rate, bit_duration,
+                                       _sample_dtype(frames.dtype), first_symbol)
+    i_component = _correlate(frames, sin_rows)
+    q_component = _correlate(frames, cos_rows)
+    # The sin carrier carries cos(theta) (second bit), the cos carrier sin(theta) (first bit).
+    demodulated = np.stack((q_component < 0, i_component < 0), axis=-1)
+    return demodulated.reshape(frames.shape[:-2] + (-1,)).astype(np.uint8)
+
+def _oversample(symbols: np.ndarray, samples_per_symbol: int) -> np.ndarray:
+    if samples_per_symbol == 1:
+        return symbols
+    return np.repeat(symbols, samples_per_symbol, axis=-1)
+
+def _integrate(received_signal: np.ndarray, samples_per_symbol: int) -> np.ndarray:
+    signal = np.asarray(received_signal)
+    if samples_per_symbol == 1:
+        return signal
+    num_symbols = signal.shape[-1] // samples_per_symbol
+    frames = signal[..., :num_symbols * samples_per_symbol]
+    return frames.reshape(signal.shape[:-1] + (num_symbols, samples_per_symbol)).sum(axis=-1)
+
+def _complex_dtype(dtype) -> type:
+    return np.complex64 if _sample_dtype(dtype) == np.float32 else np.complex128
+
+def bpsk_modulate_baseband(binary_sequence: np.ndarray, samples_per_symbol: int = 1, dtype=np.float64) -> np.ndarray:
+    dtype = _complex_dtype(dtype)
+    symbols = np.where(np.asarray(binary_sequence) == 1, dtype(1), dtype(-1))
+    return _oversample(symbols, samples_per_symbol)
+
+def bpsk_demodulate_baseband(received_signal: np.ndarray, samples_per_symbol: int = 1) -> np.ndarray:
+    return (np.real(_integrate(received_signal, samples_per_symbol)) > 0).astype(np.uint8)
+
+def qpsk_modulate_baseband(binary_sequence: np.ndarray, samples_per_symbol: int = 1, dtype=np.float64) -> np.ndarray:
+    bits = np.asarray(binary_sequence)
+    if bits.shape[-1] % 2 != 0:
+        raise ValueError("Binary sequence length must be even for QPSK.")
+    index = _qpsk_index(bits)
+    constellation = (_QPSK_I + 1j * _QPSK_Q).astype(_complex_dtype(dtype))
+    return _oversample(constellation[index], samples_per_symbol)
+
+def qpsk_demodulate_baseband(received_signal: np.ndarray, samples_per_symbol: int = 1) -> np.ndarray:
+    symbols = _integrate(received_signal, samples_per_symbol)
+    demodulated = np.stack((np.imag(symbols) < 0, np.real(symbols) < 0), axis=-1)
+    return demodulated.reshape(symbols.shape[:-1] + (-1,)).astype(np.uint8)
@@ -13,9 +13,77 @@ def chirp(start_freq: float, end_freq: float, duration: float, sample_rate: floa
     k = (end_freq - start_freq) / duration
     return np.sin(2 * np.pi * (start_freq * t + 0.5 * k * t ** 2))
 
-def random_binary_sequence(length: int) -> np.ndarray:
-    return np.random.randint(0, 2, length)
+def random_binary_sequence(length: int, rng: np.random.Generator = None) -> np.ndarray:
+    if rng is None:
+        return np.random.randint(0, 2, length, dtype=np.uint8)
+    return rng.integers(0, 2, length, dtype=np.uint8)
 
-def text_to_binary(text: str) -> np.ndarray:
-    binary_str = ''.join(format(ord(char), '08b') for char in text)
-    return np.array([int(bit) for bit in binary_str])
\ No newline at end of file
+def bytes_to_binary(data: bytes) -> np.ndarray:
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+
+def binary_to_bytes(bits: np.ndarray) -> bytes:
+    return np.packbits(np.asarray(bits, dtype=np.uint8)).tobytes()
+
+def text_to_binary(text: str, encoding: str = 'utf-8') -> np.ndarray:
+    return bytes_to_binary(text.encode(encoding))
+
+def binary_to_text(bits: np.ndarray, encoding: str = 'utf-8', errors: str = 'strict') -> str:
+    return binary_to_bytes(bits).decode(encoding, errors)
+
+_IQ_FORMATS = {'float32': np.float32, 'int16': np.int16}
+
+def _iq_source(path: str, fmt: str, iq: bool) -> np.ndarray:
+    if fmt == 'npy':
+        return np.load(path, mmap_mode='r')
+    if fmt not in _IQ_FORMATS:
+        raise ValueError("fmt must be 'float32', 'int16' or 'npy'.")
+    if fmt == 'float32' and iq:
+        # Interleaved float32 I/Q has exactly the complex64 memory layout.
+        return np.memmap(path, dtype=np.complex64, mode='r')
+    raw = np.memmap(path, dtype=_IQ_FORMATS[fmt], mode='r')
+    return raw.reshape(-1, 2) if iq else raw
+
+def _iq_chunks(source: np.ndarray, start: int, stop: int, chunk_size: int, iq: bool, scale: float):
+    for begin in range(start, stop, chunk_size):
+        chunk = source[begin:min(begin + chunk_size, stop)]
+        if chunk.dtype == np.int16:
+            chunk = chunk.astype(np.float32) / np.float32(scale)
+            if iq:
+                chunk = chunk.view(np.complex64)[:, 0]
+        yield chunk
+
+def read_iq(path: str, fmt: str = 'float32', chunk_size: int = 1 << 20, iq: bool = True,
+            scale: float = 32767.0, offset: int = 0, count: int = None, samples_per_symbol: int = 1):
+    # Chunks hold whole symbols so each can be fed straight to a demodulator,
+    # passing the running symbol count as its first_symbol.
+    # The source is opened here, not in the generator, so a bad fmt raises at once.
+    source = _iq_source(path, fmt, iq)
+    if samples_per_symbol < 1:
+        raise ValueError("samples_per_symbol must be a positive number of samples.")
+    chunk_size = max(samples_per_symbol, chunk_size - chunk_size % samples_per_symbol)
+    stop = len(source) if count is None else min(len(source), offset + count)
+    return _iq_chunks(source, offset, stop, chunk_size, iq, scale)
+
+def write_iq(path: str, samples: np.ndarray, fmt: str = 'float32', iq: bool = True,
+             scale: float = 32767.0, append: bool = False, chunk_size: int = 1 << 20) -> None:
+    samples = np.asarray(samples)
+    if fmt == 'npy':
+        if append:
+            raise ValueError("append is only supported for raw formats.")
+        dtype = np.complex64 if iq else np.float32
+        target = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=samples.shape)
+        for start in range(0, len(samples), chunk_size):
+            target[start:start + chunk_size] = samples[start:start + chunk_size]
+        target.flush()
+        del target
+        return
+    if fmt not in _IQ_FORMATS:
+        raise ValueError("fmt must be 'float32', 'int16' or 'npy'.")
+    with open(path, 'ab' if append else 'wb') as f:
+        for start in range(0, len(samples), chunk_size):
+            chunk = samples[start:start + chunk_size]
+            if iq:
+                chunk = np.stack((np.real(chunk), np.imag(chunk)), axis=-1)
+            if fmt == 'int16':
+                chunk = np.clip(np.round(chunk * scale), -32768, 32767)
+            chunk.astype(_IQ_FORMATS[fmt]).tofile(f)
\ No newline at end of file
@@ -1,13 +1,93 @@
+import itertools
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
 from .signals import random_binary_sequence
-from .modulation import bpsk_modulate, bpsk_demodulate, qpsk_modulate, qpsk_demodulate
+from .modulation import (bpsk_modulate, bpsk_demodulate, qpsk_modulate, qpsk_demodulate,
+                         bpsk_modulate_baseband, bpsk_demodulate_baseband,
+                         qpsk_modulate_baseband, qpsk_demodulate_baseband, _samples_per_symbol)
 from .channels import awgn
 from .error_correction import hamming_encode, hamming_decode
 from .metrics import calculate_ber
+from .synchronization import BARKER_13, align_payload
+
+def _wilson_interval(errors: int, bits: int, confidence: float) -> tuple:
+    if bits == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = errors / bits
+    denom = 1 + z ** 2 / bits
+    center = (p + z ** 2 / (2 * bits)) / denom
+    half = z * np.sqrt(p * (1 - p) / bits + z ** 2 / (4 * bits ** 2)) / denom
+    return max(0.0, float(center - half)), min(1.0, float(center + half))
+
+def _count_errors(original: np.ndarray, received: np.ndarray) -> int:
+    return int(np.count_nonzero(original != received))
+
+def _sweep_point(task: tuple) -> dict:
+    config, snr_db, seed_seq, options = task
+    system = CommunicationSystem(snr_db=snr_db, rng=np.random.default_rng(seed_seq), **config)
+    errors = bits = frames = 0
+    while True:
+        result = system.run_batch(options['frames_per_batch'], options['frame_length'])
+        errors += _count_errors(result['original_signal'], result['demodulated_signal'])
+        bits += result['original_signal'].size
+        frames += options['frames_per_batch']
+        ci_low, ci_high = _wilson_interval(errors, bits, options['confidence'])
+        ber = errors / bits
+        if errors >= options['target_errors'] or bits >= options['max_bits']:
+            break
+        if options['rel_precision'] is not None and errors > 0 and \
+                (ci_high - ci_low) / 2 <= options['rel_precision'] * ber:
+            break
+    return {
+        'modulation_type': config['modulation_type'],
+        'use_error_correction': config['use_error_correction'],
+        'baseband': config['baseband'],
+        'snr_db': snr_db,
+        'frames': frames,
+        'bits': bits,
+        'errors': errors,
+        'ber': ber,
+        'ci_low': ci_low,
+        'ci_high': ci_high
+    }
+
+def ber_sweep(snr_db_values, carrier_freq: float, sample_rate: float, bit_duration: float,
+              modulation_types=('bpsk',), error_correction=(False,), frame_length: int = 1000,
+              frames_per_batch: int = 10, target_errors: int = 100, max_bits: int = 1000000,
+              rel_precision: float = None, confidence: float = 0.95, num_workers: int = None,
+              seed=None, baseband: bool = False, samples_per_symbol: int = 1, dtype=np.float64,
+              max_delay: int = 0) -> list:
+    configs = [
+        {'modulation_type': m, 'use_error_correction': ec, 'carrier_freq': carrier_freq,
+         'sample_rate': sample_rate, 'bit_duration': bit_duration,
+         'baseband': baseband, 'samples_per_symbol': samples_per_symbol, 'dtype': dtype,
+         'max_delay': max_delay}
+        for m, ec in itertools.product(modulation_types, error_correction)
+    ]
+    points = list(itertools.product(configs, snr_db_values))
+    seeds = np.random.SeedSequence(seed).spawn(len(points))
+    options = {
+        'frame_length': frame_length, 'frames_per_batch': frames_per_batch,
+        'target_errors': target_errors, 'max_bits': max_bits,
+        'rel_precision': rel_precision, 'confidence': confidence
+    }
+    tasks = [(config, snr, seq, options) for (config, snr), seq in zip(points, seeds)]
+    if num_workers == 1:
+        return [_sweep_point(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=num_workers) as pool:
+        return list(pool.map(_sweep_point, tasks))
 
 class CommunicationSystem:
     def __init__(self, modulation_type: str, snr_db: float, carrier_freq: float,
-                 sample_rate: float, bit_duration: float, use_error_correction: bool = False):
+                 sample_rate: float, bit_duration: float, use_error_correction: bool = False,
+                 rng: np.random.Generator = None, baseband: bool = False, samples_per_symbol: int = 1,
+                 dtype=np.float64, max_delay: int = 0, preamble: np.ndarray = BARKER_13):
         if modulation_type not in ['bpsk', 'qpsk']:
             raise ValueError("Modulation type must be 'bpsk' or 'qpsk'.")
         self.modulation_type = modulation_type
@@ -16,49 +96,217 @@ class CommunicationSystem:
         self.sample_rate = sample_rate
         self.bit_duration = bit_duration
         self.use_error_correction = use_error_correction
+        self.rng = rng
+        self.baseband = baseband
+        self.samples_per_symbol = samples_per_symbol
+        self.dtype = dtype
+        self.max_delay = max_delay
+        self.preamble = np.array(preamble, dtype=np.uint8)
+        self.hooks = []
+
+    def add_hook(self, hook) -> None:
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook) -> None:
+        self.hooks.remove(hook)
+
+    @contextmanager
+    def profile(self):
+        records = []
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        self.add_hook(records.append)
+        try:
+            yield records
+        finally:
+            self.remove_hook(records.append)
+            if started:
+                tracemalloc.stop()
+
+    def _stage(self, name: str, func, *args):
+        if not self.hooks:
+            return func(*args)
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        result = func(*args)
+        seconds = time.perf_counter() - start
+        record = {
+            'stage': name,
+            'seconds': seconds,
+            'samples': int(np.size(args[0] if isinstance(args[0], np.ndarray) else result)),
+            'peak_bytes': tracemalloc.get_traced_memory()[1] - baseline if tracing else None
+        }
+        for hook in self.hooks:
+            hook(record)
+        return result
 
     def generate_signal(self, length: int) -> np.ndarray:
-        return random_binary_sequence(length)
+        return random_binary_sequence(length, self.rng)
+
+    def channel_snr_db(self) -> float:
+        # snr_db is the per-sample SNR of the passband waveform. The baseband
+        # model keeps the same Eb/N0: a real carrier of unit amplitude has
+        # half the power per sample and sample_rate * bit_duration samples per
+        # symbol, against samples_per_symbol unit-power complex samples.
+        if not self.baseband:
+            return self.snr_db
+        sps = _samples_per_symbol(self.sample_rate, self.bit_duration)
+        return self.snr_db + 10 * np.log10(sps / (2 * self.samples_per_symbol))
 
     def modulate(self, signal: np.ndarray) -> np.ndarray:
+        if self.baseband:
+            if self.modulation_type == 'bpsk':
+                return bpsk_modulate_baseband(signal, self.samples_per_symbol, self.dtype)
+            return qpsk_modulate_baseband(signal, self.samples_per_symbol, self.dtype)
         if self.modulation_type == 'bpsk':
-            return bpsk_modulate(signal, self.carrier_freq, self.sample_rate, self.bit_duration)
+            return bpsk_modulate(signal, self.carrier_freq, self.sample_rate, self.bit_duration, self.dtype)
         else:
-            return qpsk_modulate(signal, self.carrier_freq, self.sample_rate, self.bit_duration)
+            return qpsk_modulate(signal, self.carrier_freq, self.sample_rate, self.bit_duration, self.dtype)
+
+    def preamble_waveform(self) -> np.ndarray:
+        if self.baseband:
+            return bpsk_modulate_baseband(self.preamble, self.samples_per_symbol, self.dtype)
+        return bpsk_modulate(self.preamble, self.carrier_freq, self.sample_rate, self.bit_duration, self.dtype)
+
+    def add_preamble(self, modulated_signal: np.ndarray) -> np.ndarray:
+        preamble = self.preamble_waveform()
+        preamble = np.broadcast_to(preamble, modulated_signal.shape[:-1] + preamble.shape)
+        return np.concatenate((preamble, modulated_signal), axis=-1)
 
     def add_channel_effects(self, modulated_signal: np.ndarray) -> np.ndarray:
-        return awgn(modulated_signal, self.snr_db)
+        if not self.max_delay:
+            return awgn(modulated_signal, self.channel_snr_db(), self.rng)
+        # Each frame is shifted by a random whole number of samples inside a
+        # window max_delay samples longer. The SNR is corrected for the padding
+        # so the frame sees the same noise level as without delay.
+        length = modulated_signal.shape[-1]
+        if self.rng is None:
+            delays = np.random.randint(0, self.max_delay + 1, modulated_signal.shape[:-1])
+        else:
+            delays = self.rng.integers(0, self.max_delay + 1, modulated_signal.shape[:-1])
+        delayed = np.zeros(modulated_signal.shape[:-1] + (length + self.max_delay,), dtype=modulated_signal.dtype)
+        index = np.asarray(delays)[..., None] + np.arange(length)
+        np.put_along_axis(delayed, index, modulated_signal, -1)
+        snr_db = self.channel_snr_db() + 10 * np.log10(length / (length + self.max_delay))
+        return awgn(delayed, snr_db, self.rng, out=delayed)
+
+    def synchronize(self, received_signal: np.ndarray, payload_length: int) -> np.ndarray:
+        return align_payload(received_signal, self.preamble_waveform(), payload_length, max_offset=self.max_delay)
 
     def demodulate(self, received_signal: np.ndarray) -> np.ndarray:
+        if self.baseband:
+            if self.modulation_type == 'bpsk':
+                return bpsk_demodulate_baseband(received_signal, self.samples_per_symbol)
+            return qpsk_demodulate_baseband(received_signal, self.samples_per_symbol)
         if self.modulation_type == 'bpsk':
             return bpsk_demodulate(received_signal, self.carrier_freq, self.sample_rate, self.bit_duration)
         else:
             return qpsk_demodulate(received_signal, self.carrier_freq, self.sample_rate, self.bit_duration)
 
-    def run_simulation(self, data_length: int) -> dict:
+    def run_simulation(self, data_length: int, frame_length: int = None, capture_frames: int = 0) -> dict:
+        if frame_length is not None:
+            stats = {'total_bits': 0, 'total_errors': 0, 'ber': 0.0, 'capture': []}
+            for stats in self.stream_simulation(data_length, frame_length, capture_frames):
+                pass
+            return {
+                'bits': stats['total_bits'],
+                'errors': stats['total_errors'],
+                'ber': stats['ber'],
+                'capture': stats['capture']
+            }
         if self.modulation_type == 'qpsk' and data_length % 2 != 0:
             data_length += 1
-        original_signal = self.generate_signal(data_length)
-        if self.use_error_correction:
-            if data_length % 4 != 0:
-                pad = 4 - (data_length % 4)
-                original_signal = np.pad(original_signal, (0, pad), mode='constant')
-            signal_to_modulate = hamming_encode(original_signal)
-        else:
-            signal_to_modulate = original_signal
-        modulated = self.modulate(signal_to_modulate)
-        received = self.add_channel_effects(modulated)
-        demodulated = self.demodulate(received)
-        if self.use_error_correction:
-            decoded = hamming_decode(demodulated)
-            final_signal = decoded[:data_length]
-        else:
-            final_signal = demodulated[:data_length]
-        ber = calculate_ber(original_signal, final_signal)
+        original_signal = self._stage('generate', self.generate_signal, data_length)
+        modulated, received, final = self._transmit_frames(original_signal[None, :])
+        modulated, received, final_signal = modulated[0], received[0], final[0]
+        ber = self._stage('ber', calculate_ber, original_signal, final_signal)
         return {
             'original_signal': original_signal,
             'modulated_signal': modulated,
             'received_signal': received,
             'demodulated_signal': final_signal,
             'ber': ber
-        }
\ No newline at end of file
+        }
+
+    def sweep(self, snr_db_values, **kwargs) -> list:
+        return ber_sweep(snr_db_values, self.carrier_freq, self.sample_rate, self.bit_duration,
+                         modulation_types=(self.modulation_type,),
+                         error_correction=(self.use_error_correction,), baseband=self.baseband,
+                         samples_per_symbol=self.samples_per_symbol, dtype=self.dtype,
+                         max_delay=self.max_delay, **kwargs)
+
+    def _receive(self, modulated: np.ndarray) -> np.ndarray:
+        if not self.max_delay:
+            return self._stage('channel', self.add_channel_effects, modulated)
+        received = self._stage('channel', self.add_channel_effects, self.add_preamble(modulated))
+        return self._stage('synchronize', self.synchronize, received, modulated.shape[-1])
+
+    def _transmit_frames(self, original_frames: np.ndarray) -> tuple:
+        num_frames, frame_length = original_frames.shape
+        if self.use_error_correction:
+            block = 8 if self.modulation_type == 'qpsk' else 4
+            pad = -frame_length % block
+            padded = np.pad(original_frames, ((0, 0), (0, pad)), mode='constant')
+            signal_to_modulate = self._stage('encode', hamming_encode, padded.ravel()).reshape(num_frames, -1)
+        else:
+            signal_to_modulate = original_frames
+        modulated = self._stage('modulate', self.modulate, signal_to_modulate)
+        received = self._receive(modulated)
+        demodulated = self._stage('demodulate', self.demodulate, received)
+        if self.use_error_correction:
+            decoded = self._stage('decode', hamming_decode, demodulated.ravel()).reshape(num_frames, -1)
+            final_frames = decoded[:, :frame_length]
+        else:
+            final_frames = demodulated[:, :frame_length]
+        return modulated, received, final_frames
+
+    def run_batch(self, num_frames: int, frame_length: int) -> dict:
+        if self.modulation_type == 'qpsk' and frame_length % 2 != 0:
+            frame_length += 1
+        original_frames = self._stage('generate', self.generate_signal, num_frames * frame_length)
+        original_frames = original_frames.reshape(num_frames, frame_length)
+        _, _, final_frames = self._transmit_frames(original_frames)
+        frame_ber = np.mean(original_frames != final_frames, axis=1)
+        return {
+            'original_signal': original_frames,
+            'demodulated_signal': final_frames,
+            'frame_ber': frame_ber,
+            'ber': self._stage('ber', calculate_ber, original_frames.ravel(), final_frames.ravel())
+        }
+
+    def stream_simulation(self, data_length: int, frame_length: int = 1000, capture_frames: int = 0):
+        if self.modulation_type == 'qpsk' and frame_length % 2 != 0:
+            frame_length += 1
+        total_bits = total_errors = 0
+        capture = deque(maxlen=capture_frames)
+        for index, start in enumerate(range(0, data_length, frame_length)):
+            length = min(frame_length, data_length - start)
+            if self.modulation_type == 'qpsk' and length % 2 != 0:
+                length += 1
+            original = self._stage('generate', self.generate_signal, length)
+            modulated, received, final = self._transmit_frames(original[None, :])
+            errors = self._stage('ber', _count_errors, original, final[0])
+            total_bits += length
+            total_errors += errors
+            if capture_frames:
+                capture.append({
+                    'frame': index,
+                    'original_signal': original,
+                    'modulated_signal': modulated[0],
+                    'received_signal': received[0],
+                    'demodulated_signal': final[0]
+                })
+            yield {
+                'frame': index,
+                'bits': length,
+                'errors': errors,
+                'total_bits': total_bits,
+                'total_errors': total_errors,
+                'ber': total_errors / total_bits,
+                'capture': list(capture)
+            }
@@ -0,0 +1,190 @@
+import numpy as np
+
+BARKER_13 = np.array([1, 1, 1, 1, 1, 0, 0, 1, 1, 0, 1, 0, 1], dtype=np.uint8)
+BARKER_13.setflags(write=False)
+
+def _analytic(signal: np.ndarray) -> np.ndarray:
+    # Analytic signal via the FFT Hilbert transform, so real passband templates
+    # yield a complex correlation whose angle is the carrier phase.
+    n = signal.shape[-1]
+    h = np.zeros(n)
+    h[0] = 1
+    h[1:(n + 1) // 2] = 2
+    if n % 2 == 0:
+        h[n // 2] = 1
+    return np.fft.ifft(np.fft.fft(signal, axis=-1) * h, axis=-1)
+
+def _matched_template(preamble: np.ndarray) -> np.ndarray:
+    preamble = np.asarray(preamble)
+    return preamble if np.iscomplexobj(preamble) else _analytic(preamble)
+
+def fft_correlate(signal: np.ndarray, template: np.ndarray) -> np.ndarray:
+    # c[k] = sum_n signal[k + n] * conj(template[n]) for every lag where the
+    # template fits, computed along the last axis in O(N log N).
+    signal = np.asarray(signal)
+    template = np.asarray(template)
+    num_lags = signal.shape[-1] - len(template) + 1
+    if num_lags < 1:
+        return np.zeros(signal.shape[:-1] + (0,), dtype=np.result_type(signal, template))
+    n = 1 << int(np.ceil(np.log2(signal.shape[-1] + len(template) - 1)))
+    if np.iscomplexobj(signal) or np.iscomplexobj(template):
+        spectrum = np.fft.fft(signal, n, axis=-1) * np.conj(np.fft.fft(template, n))
+        return np.fft.ifft(spectrum, axis=-1)[..., :num_lags]
+    spectrum = np.fft.rfft(signal, n, axis=-1) * np.conj(np.fft.rfft(template, n))
+    return np.fft.irfft(spectrum, n, axis=-1)[..., :num_lags]
+
+def _normalized_correlation(signal: np.ndarray, template: np.ndarray, template_energy: float,
+                            min_energy: float = 0.0) -> tuple:
+    corr = fft_correlate(signal, template)
+    length = len(template)
+    energy = np.cumsum(np.abs(signal) ** 2, axis=-1)
+    energy = np.concatenate((np.zeros(energy.shape[:-1] + (1,)), energy), axis=-1)
+    window_energy = energy[..., length:length + corr.shape[-1]] - energy[..., :corr.shape[-1]]
+    # Floor far above cumsum rounding so silent stretches do not divide ~0 by ~0.
+    floor = np.maximum(1e-10 * energy[..., -1:], np.finfo(float).tiny)
+    magnitude = np.abs(corr) / np.sqrt(np.maximum(window_energy, floor) * template_energy)
+    if min_energy:
+        # The normalized value ignores signal level, so quiet noise could pass
+        # the threshold; windows without enough absolute energy are dropped.
+        magnitude[window_energy < min_energy] = 0.0
+    return corr, magnitude
+
+def _refine(corr: np.ndarray, magnitude: np.ndarray, peak: np.ndarray) -> tuple:
+    # Parabolic interpolation of the correlation magnitude around each peak.
+    last = magnitude.shape[-1] - 1
+    left = np.take_along_axis(magnitude, np.clip(peak - 1, 0, last)[..., None], -1)[..., 0]
+    center = np.take_along_axis(magnitude, peak[..., None], -1)[..., 0]
+    right = np.take_along_axis(magnitude, np.clip(peak + 1, 0, last)[..., None], -1)[..., 0]
+    denom = left - 2 * center + right
+    safe = np.where(denom == 0, 1, denom)
+    fraction = np.where((denom == 0) | (peak == 0) | (peak == last), 0.0, 0.5 * (left - right) / safe)
+    phase = np.angle(np.take_along_axis(corr, peak[..., None], -1)[..., 0])
+    return fraction, phase, center
+
+def _carrier_radius(preamble: np.ndarray) -> int:
+    # Half the period of the strongest spectral line of a real preamble.
+    n = 1 << int(np.ceil(np.log2(8 * len(preamble))))
+    k = np.argmax(np.abs(np.fft.rfft(preamble, n))[1:]) + 1
+    return int(n / k // 2)
+
+def _snap_to_carrier(corr: np.ndarray, peak: np.ndarray, radius: int) -> np.ndarray:
+    # For real passband signals the correlation envelope is a carrier period
+    # wide; the lag with the largest in-phase correlation near its peak is the
+    # one that lines the carrier up with a coherent demodulator.
+    if radius < 1:
+        return peak
+    last = corr.shape[-1] - 1
+    lags = np.clip(peak[..., None] + np.arange(-radius, radius + 1), 0, last)
+    in_phase = np.take_along_axis(corr.real, lags, -1)
+    return np.take_along_axis(lags, np.argmax(in_phase, axis=-1)[..., None], -1)[..., 0]
+
+def _estimate(corr: np.ndarray, magnitude: np.ndarray, peak: np.ndarray, radius: int) -> dict:
+    fraction, phase, value = _refine(corr, magnitude, peak)
+    offset = _snap_to_carrier(corr, peak, radius)
+    return {'offset': offset, 'fraction': peak + fraction - offset, 'phase': phase, 'peak': value}
+
+def find_preamble(signal: np.ndarray, preamble: np.ndarray, max_offset: int = None) -> dict:
+    # offset is the integer lag to align on; offset + fraction is the
+    # interpolated timing of the correlation peak and phase the carrier phase.
+    preamble = np.asarray(preamble)
+    template = _matched_template(preamble)
+    template_energy = np.sum(np.abs(preamble) ** 2)
+    signal = np.asarray(signal)
+    if max_offset is not None:
+        signal = signal[..., :max_offset + len(template)]
+    corr, magnitude = _normalized_correlation(signal, template, template_energy)
+    peak = np.argmax(magnitude, axis=-1)
+    radius = 0 if np.iscomplexobj(signal) or np.iscomplexobj(preamble) else _carrier_radius(preamble)
+    return _estimate(corr, magnitude, peak, radius)
+
+def align_payload(signal: np.ndarray, preamble: np.ndarray, payload_length: int, detection: dict = None,
+                  max_offset: int = None) -> np.ndarray:
+    signal = np.asarray(signal)
+    if detection is None:
+        detection = find_preamble(signal, preamble, max_offset)
+    start = np.asarray(detection['offset'])[..., None] + len(preamble)
+    index = np.clip(start + np.arange(payload_length), 0, signal.shape[-1] - 1)
+    payload = np.take_along_axis(signal, np.broadcast_to(index, signal.shape[:-1] + (payload_length,)), -1)
+    if np.iscomplexobj(payload):
+        payload = payload * np.exp(-1j * np.asarray(detection['phase']))[..., None].astype(payload.dtype)
+    return payload
+
+class FrameSynchronizer:
+    def __init__(self, preamble: np.ndarray, payload_length: int = 0, threshold: float = 0.6,
+                 min_energy: float = None):
+        self.preamble = np.asarray(preamble)
+        self.template = _matched_template(self.preamble)
+        self.template_energy = np.sum(np.abs(self.preamble) ** 2)
+        self.radius = 0 if np.iscomplexobj(self.preamble) else _carrier_radius(self.preamble)
+        self.payload_length = payload_length
+        self.threshold = threshold
+        # By default a window must hold a quarter of the preamble's energy,
+        # i.e. the preamble may arrive at down to half its nominal amplitude.
+        self.min_energy = 0.25 * self.template_energy if min_energy is None else min_energy
+        self.reset()
+
+    def reset(self) -> None:
+        self._buffer = np.zeros(0, dtype=self.preamble.dtype)
+        self._base = 0
+        self._next_lag = 0
+        self._blank_until = 0
+        self._pending = []
+
+    def process(self, chunk: np.ndarray) -> list:
+        return self._run(np.asarray(chunk), final=False)
+
+    def flush(self) -> list:
+        return self._run(np.zeros(0, dtype=self._buffer.dtype), final=True)
+
+    def _detect(self, buffer: np.ndarray, final: bool) -> list:
+        # A lag is only decided once `length` later lags exist, so a peak is
+        # never split across chunks; earlier lags are kept for the left check.
+        # No new frame is searched for inside a detected frame's payload.
+        length = len(self.preamble)
+        num_lags = len(buffer) - length + 1
+        start = self._next_lag - self._base
+        stop = num_lags if final else num_lags - length
+        if stop <= start:
+            return []
+        corr, magnitude = _normalized_correlation(buffer, self.template, self.template_energy, self.min_energy)
+        candidates = np.nonzero(magnitude[start:stop] >= self.threshold)[0] + start
+        detections = []
+        for peak in candidates:
+            if self._base + peak < self._blank_until:
+                continue
+            left = magnitude[max(0, peak - length):peak]
+            right = magnitude[peak + 1:peak + length + 1]
+            if (len(left) and left.max() >= magnitude[peak]) or (len(right) and right.max() > magnitude[peak]):
+                continue
+            radius = 0 if np.iscomplexobj(buffer) else self.radius
+            estimate = _estimate(corr, magnitude, np.array(peak), radius)
+            detections.append({
+                'offset': self._base + int(estimate['offset']),
+                'fraction': float(estimate['fraction']),
+                'phase': float(estimate['phase']),
+                'peak': float(estimate['peak'])
+            })
+            self._blank_until = self._base + int(peak) + length + self.payload_length
+        self._next_lag = self._base + stop
+        return detections
+
+    def _run(self, chunk: np.ndarray, final: bool) -> list:
+        buffer = np.concatenate((self._buffer, chunk))
+        self._pending.extend(self._detect(buffer, final))
+        length = len(self.preamble)
+        ready, waiting = [], []
+        for detection in self._pending:
+            begin = detection['offset'] + length - self._base
+            if begin + self.payload_length <= len(buffer) or final:
+                payload = buffer[begin:begin + self.payload_length]
+                if np.iscomplexobj(payload):
+                    payload = payload * np.exp(-1j * detection['phase']).astype(payload.dtype)
+                ready.append(dict(detection, payload=payload))
+            else:
+                waiting.append(detection)
+        self._pending = waiting
+        keep = min([self._next_lag - length] + [d['offset'] + length for d in waiting])
+        cut = max(0, keep - self._base)
+        self._buffer = buffer[cut:]
+        self._base += cut
+        return ready
@@ -0,0 +1,61 @@
+import unittest
+import numpy as np
+from CommX.channels import awgn, block_fading, BlockFadingChannel, tapped_delay_line, MultipathChannel, multipath
+
+class TestChannels(unittest.TestCase):
+    def test_awgn_snr_and_in_place(self):
+        rng = np.random.default_rng(0)
+        signal = (rng.standard_normal(200000) + 1j * rng.standard_normal(200000)).astype(np.complex64)
+        clean = signal.copy()
+        noisy = awgn(signal, 10, rng, out=signal)
+        self.assertIs(noisy, signal)
+        self.assertEqual(noisy.dtype, np.complex64)
+        snr = 10 * np.log10(np.mean(np.abs(clean) ** 2) / np.mean(np.abs(noisy - clean) ** 2))
+        self.assertAlmostEqual(snr, 10, delta=0.1)
+
+    def test_awgn_legacy_stream_is_unchanged(self):
+        signal = np.exp(1j * np.arange(150000)).astype(np.complex64)
+        np.random.seed(8)
+        noisy = awgn(signal, 3)
+        np.random.seed(8)
+        noise = np.random.normal(0, 1, signal.shape) + 1j * np.random.normal(0, 1, signal.shape)
+        expected = signal + noise * np.sqrt(10 ** -0.3 / 2)
+        self.assertEqual(noisy.dtype, np.complex64)
+        np.testing.assert_allclose(noisy, expected, atol=1e-5)
+
+    def test_awgn_float32(self):
+        signal = np.ones(1000, dtype=np.float32)
+        self.assertEqual(awgn(signal, 10, np.random.default_rng(1)).dtype, np.float32)
+
+    def test_block_fading_holds_gain_per_block(self):
+        faded, gains = block_fading(np.ones(10, dtype=complex), 4, np.random.default_rng(2), return_gains=True)
+        self.assertEqual(gains.shape, (3,))
+        np.testing.assert_allclose(faded, np.repeat(gains, 4)[:10])
+
+    def test_block_fading_streaming_matches_single_call(self):
+        signal = np.random.default_rng(4).standard_normal(103)
+        expected = block_fading(signal, 10, np.random.default_rng(5))
+        channel = BlockFadingChannel(10, np.random.default_rng(5))
+        streamed = np.concatenate([channel.process(chunk) for chunk in np.array_split(signal, [3, 7, 7, 40, 95])])
+        np.testing.assert_allclose(streamed, expected)
+
+    def test_fading_follows_global_seed_without_rng(self):
+        runs = []
+        for _ in range(2):
+            np.random.seed(6)
+            runs.append((block_fading(np.ones(20), 4), tapped_delay_line([0, 3], [0, -3])))
+        np.testing.assert_array_equal(runs[0][0], runs[1][0])
+        np.testing.assert_array_equal(runs[0][1], runs[1][1])
+
+    def test_multipath_streaming_matches_convolution(self):
+        rng = np.random.default_rng(3)
+        taps = tapped_delay_line([0, 2, 17], [0, -3, -6], rng)
+        signal = rng.standard_normal(3000)
+        expected = np.convolve(signal, taps)[:len(signal)]
+        channel = MultipathChannel(taps, fft_size=64)
+        streamed = np.concatenate([channel.process(chunk) for chunk in np.array_split(signal, [7, 1000, 1001])])
+        np.testing.assert_allclose(streamed, expected, atol=1e-9)
+        np.testing.assert_allclose(multipath(signal, taps), expected, atol=1e-9)
+
+if __name__ == '__main__':
+    unittest.main()
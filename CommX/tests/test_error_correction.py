@@ -0,0 +1,34 @@
+import unittest
+import numpy as np
+from CommX.error_correction import hamming_encode, hamming_decode
+
+class TestErrorCorrection(unittest.TestCase):
+    def test_hamming_corrects_single_errors(self):
+        for m, n in [(3, 7), (4, 15)]:
+            k = n - m
+            data = np.random.randint(0, 2, 10 * k)
+            encoded = hamming_encode(data, m)
+            received = encoded.copy()
+            received[np.arange(10) * n + np.random.randint(0, n, 10)] ^= 1
+            decoded = hamming_decode(received, m)
+            np.testing.assert_array_equal(decoded, data)
+            self.assertEqual((encoded.dtype, decoded.dtype), (np.uint8, np.uint8))
+            self.assertFalse(np.array_equal(received, encoded))
+
+    def test_secded_detects_double_errors(self):
+        data = np.random.randint(0, 2, 40).astype(np.uint8)
+        received = hamming_encode(data, extended=True)
+        received[[0, 1]] ^= 1
+        received[9] ^= 1
+        decoded, status = hamming_decode(received, extended=True, return_status=True)
+        np.testing.assert_array_equal(status[:3], [2, 1, 0])
+        np.testing.assert_array_equal(decoded[4:], data[4:])
+
+    def test_packed_round_trip(self):
+        data = np.frombuffer(b'CommX', dtype=np.uint8)
+        encoded = hamming_encode(data, packed=True)
+        self.assertEqual(encoded.dtype, np.uint8)
+        np.testing.assert_array_equal(hamming_decode(encoded, packed=True), data)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,17 @@
+import unittest
+import numpy as np
+from CommX.metrics import calculate_ber
+
+class TestMetrics(unittest.TestCase):
+    def test_ber(self):
+        self.assertEqual(calculate_ber(np.array([0, 1, 1, 0]), np.array([0, 1, 0, 0])), 0.25)
+
+    def test_packed_ber_ignores_padding(self):
+        original, received = np.packbits([1, 0, 1]), np.packbits([1, 1, 1])
+        self.assertAlmostEqual(calculate_ber(original, received, packed=True, num_bits=3), 1 / 3)
+        self.assertEqual(calculate_ber(original, received, packed=True), 1 / 8)
+        with self.assertRaises(ValueError):
+            calculate_ber(original, received, packed=True, num_bits=9)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 import numpy as np
-from CommX.modulation import bpsk_modulate, bpsk_demodulate
+from CommX.modulation import (bpsk_modulate, bpsk_demodulate, qpsk_modulate, qpsk_demodulate,
+                              bpsk_modulate_baseband, bpsk_demodulate_baseband,
+                              qpsk_modulate_baseband, qpsk_demodulate_baseband)
 
 class TestModulation(unittest.TestCase):
     def test_bpsk(self):
@@ -12,5 +14,68 @@ class TestModulation(unittest.TestCase):
         demodulated = bpsk_demodulate(modulated, carrier_freq, sample_rate, bit_duration)
         np.testing.assert_array_equal(binary_sequence, demodulated)
 
+    def test_qpsk(self):
+        binary_sequence = np.array([0, 0, 0, 1, 1, 0, 1, 1])
+        modulated = qpsk_modulate(binary_sequence, 1000, 10000, 0.01)
+        demodulated = qpsk_demodulate(modulated, 1000, 10000, 0.01)
+        np.testing.assert_array_equal(binary_sequence, demodulated)
+
+    def test_baseband_round_trip(self):
+        binary_sequence = np.array([0, 0, 0, 1, 1, 0, 1, 1])
+        for modulate, demodulate in [(bpsk_modulate_baseband, bpsk_demodulate_baseband),
+                                     (qpsk_modulate_baseband, qpsk_demodulate_baseband)]:
+            for sps in (1, 4):
+                modulated = modulate(binary_sequence, sps)
+                self.assertTrue(np.iscomplexobj(modulated))
+                np.testing.assert_array_equal(demodulate(modulated, sps), binary_sequence)
+
+    def test_float32_samples_and_uint8_bits(self):
+        binary_sequence = np.random.randint(0, 2, 64).astype(np.uint8)
+        for modulate, demodulate in [(bpsk_modulate, bpsk_demodulate), (qpsk_modulate, qpsk_demodulate)]:
+            reference = modulate(binary_sequence, 1500, 8000, 0.001)
+            modulated = modulate(binary_sequence, 1500, 8000, 0.001, np.float32)
+            self.assertEqual(modulated.dtype, np.float32)
+            np.testing.assert_allclose(modulated, reference, atol=1e-6)
+            demodulated = demodulate(modulated, 1500, 8000, 0.001)
+            self.assertEqual(demodulated.dtype, np.uint8)
+            np.testing.assert_array_equal(demodulated, demodulate(reference, 1500, 8000, 0.001))
+        self.assertEqual(qpsk_modulate_baseband(binary_sequence, 2, np.float32).dtype, np.complex64)
+
+    def test_round_trip_with_fractional_carrier_cycles(self):
+        # 1500 Hz at 8 samples per symbol is 1.5 carrier cycles per symbol.
+        binary_sequence = np.random.randint(0, 2, (2, 64)).astype(np.uint8)
+        for modulate, demodulate in [(bpsk_modulate, bpsk_demodulate), (qpsk_modulate, qpsk_demodulate)]:
+            for dtype in (np.float64, np.float32):
+                modulated = modulate(binary_sequence, 1500, 8000, 0.001, dtype)
+                np.testing.assert_array_equal(demodulate(modulated, 1500, 8000, 0.001), binary_sequence)
+
+    def test_chunked_qpsk_with_first_symbol(self):
+        binary_sequence = np.random.randint(0, 2, 64).astype(np.uint8)
+        modulated = qpsk_modulate(binary_sequence, 1500, 8000, 0.001)
+        chunks = [qpsk_modulate(binary_sequence[:24], 1500, 8000, 0.001),
+                  qpsk_modulate(binary_sequence[24:], 1500, 8000, 0.001, first_symbol=12)]
+        np.testing.assert_allclose(np.concatenate(chunks), modulated, atol=1e-12)
+        demodulated = [qpsk_demodulate(modulated[:96], 1500, 8000, 0.001),
+                       qpsk_demodulate(modulated[96:], 1500, 8000, 0.001, first_symbol=12)]
+        np.testing.assert_array_equal(np.concatenate(demodulated), binary_sequence)
+
+    def test_bpsk_batch_matches_single_frames(self):
+        frames = np.random.randint(0, 2, (3, 16))
+        modulated = bpsk_modulate(frames, 1500, 8000, 0.001)
+        self.assertEqual(modulated.shape, (3, 16 * 8))
+        demodulated = bpsk_demodulate(modulated, 1500, 8000, 0.001)
+        for frame, row, bits in zip(frames, modulated, demodulated):
+            np.testing.assert_allclose(row, bpsk_modulate(frame, 1500, 8000, 0.001))
+            np.testing.assert_array_equal(bits, bpsk_demodulate(row, 1500, 8000, 0.001))
+        np.testing.assert_array_equal(demodulated, frames)
+
+    def test_qpsk_batch_matches_single_frames(self):
+        frames = np.random.randint(0, 2, (3, 16))
+        modulated = qpsk_modulate(frames, 1000, 10000, 0.01)
+        demodulated = qpsk_demodulate(modulated, 1000, 10000, 0.01)
+        for frame, row, bits in zip(frames, modulated, demodulated):
+            np.testing.assert_allclose(row, qpsk_modulate(frame, 1000, 10000, 0.01))
+            np.testing.assert_array_equal(bits, qpsk_demodulate(row, 1000, 10000, 0.01))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
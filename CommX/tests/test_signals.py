@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from CommX.modulation import bpsk_modulate, bpsk_demodulate
+from CommX.signals import text_to_binary, binary_to_text, bytes_to_binary, binary_to_bytes, read_iq, write_iq
+
+class TestSignals(unittest.TestCase):
+    def test_text_round_trip(self):
+        bits = text_to_binary('Hi')
+        np.testing.assert_array_equal(bits, [0, 1, 0, 0, 1, 0, 0, 0, 0, 1, 1, 0, 1, 0, 0, 1])
+        self.assertEqual(bits.dtype, np.uint8)
+        self.assertEqual(binary_to_text(text_to_binary('CommX ✓')), 'CommX ✓')
+        self.assertEqual(binary_to_bytes(bytes_to_binary(b'\x00\xff\x10')), b'\x00\xff\x10')
+
+    def test_iq_round_trip_in_chunks(self):
+        rng = np.random.default_rng(0)
+        samples = (rng.uniform(-1, 1, 1000) + 1j * rng.uniform(-1, 1, 1000)).astype(np.complex64)
+        with tempfile.TemporaryDirectory() as directory:
+            for fmt, atol in [('float32', 0), ('int16', 1 / 32767), ('npy', 0)]:
+                path = os.path.join(directory, 'capture.' + fmt)
+                write_iq(path, samples[:600], fmt)
+                if fmt != 'npy':
+                    write_iq(path, samples[600:], fmt, append=True)
+                else:
+                    write_iq(path, samples, fmt)
+                chunks = list(read_iq(path, fmt, chunk_size=256))
+                self.assertEqual([len(c) for c in chunks], [256, 256, 256, 232])
+                np.testing.assert_allclose(np.concatenate(chunks), samples, atol=atol)
+
+    def test_read_real_samples_window(self):
+        samples = np.arange(100, dtype=np.float32)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'capture.f32')
+            write_iq(path, samples, iq=False)
+            chunks = list(read_iq(path, iq=False, chunk_size=30, offset=10, count=50))
+            np.testing.assert_array_equal(np.concatenate(chunks), samples[10:60])
+
+    def test_replay_capture_through_demodulator(self):
+        bits = np.random.default_rng(1).integers(0, 2, 1000, dtype=np.uint8)
+        # 1500 Hz at 8000 Hz is 1.5 carrier cycles per symbol, so each chunk
+        # starts at a different carrier phase.
+        for carrier_freq, sample_rate in [(1000, 10000), (1500, 8000)]:
+            sps = int(sample_rate * 0.001)
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'bpsk.f32')
+                write_iq(path, bpsk_modulate(bits, carrier_freq, sample_rate, 0.001), iq=False)
+                demodulated = []
+                for chunk in read_iq(path, iq=False, chunk_size=1024, samples_per_symbol=sps):
+                    demodulated.append(bpsk_demodulate(chunk, carrier_freq, sample_rate, 0.001,
+                                                       first_symbol=sum(map(len, demodulated))))
+            np.testing.assert_array_equal(np.concatenate(demodulated), bits)
+
+    def test_read_iq_rejects_bad_format_eagerly(self):
+        with self.assertRaises(ValueError):
+            read_iq('missing.bin', fmt='uint8')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+from CommX.simulation import CommunicationSystem, ber_sweep
+
+class TestSimulation(unittest.TestCase):
+    def test_seeded_system_is_reproducible(self):
+        runs = [CommunicationSystem('bpsk', 0, 1000, 10000, 0.001, rng=np.random.default_rng(7)).run_simulation(200)
+                for _ in range(2)]
+        np.testing.assert_array_equal(runs[0]['received_signal'], runs[1]['received_signal'])
+
+    def test_baseband_matches_passband_ber(self):
+        rows = {}
+        for baseband in (False, True):
+            row, = ber_sweep([-6], 1000, 10000, 0.001, modulation_types=('qpsk',), frame_length=1000,
+                             target_errors=2000, max_bits=100000, num_workers=1, seed=5, baseband=baseband)
+            rows[baseband] = row
+        self.assertLess(abs(rows[True]['ber'] - rows[False]['ber']), 0.02)
+
+    def test_profile_records_every_stage(self):
+        system = CommunicationSystem('bpsk', 5, 1000, 10000, 0.001, use_error_correction=True)
+        with system.profile() as records:
+            system.run_simulation(400)
+        self.assertEqual([r['stage'] for r in records],
+                         ['generate', 'encode', 'modulate', 'channel', 'demodulate', 'decode', 'ber'])
+        self.assertEqual(records[2]['samples'], 700)
+        self.assertTrue(all(r['seconds'] >= 0 and r['peak_bytes'] is not None for r in records))
+        self.assertEqual(system.hooks, [])
+
+    def test_error_correction_pads_any_length(self):
+        for modulation_type, length, expected in [('bpsk', 2001, 2001), ('qpsk', 1001, 1002), ('qpsk', 1004, 1004)]:
+            system = CommunicationSystem(modulation_type, 20, 1000, 10000, 0.001, use_error_correction=True,
+                                         rng=np.random.default_rng(2))
+            result = system.run_simulation(length)
+            self.assertEqual(len(result['original_signal']), expected)
+            np.testing.assert_array_equal(result['demodulated_signal'], result['original_signal'])
+
+    def test_streaming_counts_every_bit(self):
+        system = CommunicationSystem('bpsk', 0, 1000, 10000, 0.001, rng=np.random.default_rng(1))
+        stats = list(system.stream_simulation(2500, frame_length=1000, capture_frames=1))
+        self.assertEqual([s['bits'] for s in stats], [1000, 1000, 500])
+        self.assertEqual(stats[-1]['total_bits'], 2500)
+        self.assertEqual(stats[-1]['total_errors'], sum(s['errors'] for s in stats))
+        self.assertEqual(len(stats[-1]['capture']), 1)
+        self.assertEqual(stats[-1]['capture'][0]['frame'], 2)
+
+    def test_ber_sweep_independent_of_workers(self):
+        kwargs = dict(frame_length=100, frames_per_batch=5, target_errors=20, max_bits=5000, seed=3)
+        serial = ber_sweep([-5, 0], 1000, 10000, 0.001, num_workers=1, **kwargs)
+        parallel = ber_sweep([-5, 0], 1000, 10000, 0.001, num_workers=2, **kwargs)
+        self.assertEqual(serial, parallel)
+        self.assertEqual([row['snr_db'] for row in serial], [-5, 0])
+        for row in serial:
+            self.assertTrue(row['errors'] >= 20 or row['bits'] >= 5000)
+            self.assertLessEqual(row['ci_low'], row['ber'])
+            self.assertLessEqual(row['ber'], row['ci_high'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import numpy as np
+from CommX.modulation import (bpsk_modulate, bpsk_demodulate, qpsk_modulate_baseband, bpsk_modulate_baseband,
+                              bpsk_demodulate_baseband)
+from CommX.synchronization import BARKER_13, fft_correlate, find_preamble, align_payload, FrameSynchronizer
+from CommX.simulation import CommunicationSystem
+
+class TestSynchronization(unittest.TestCase):
+    def test_fft_correlate_matches_direct(self):
+        rng = np.random.default_rng(0)
+        signal = rng.standard_normal(300) + 1j * rng.standard_normal(300)
+        template = rng.standard_normal(17) + 1j * rng.standard_normal(17)
+        np.testing.assert_allclose(fft_correlate(signal, template), np.correlate(signal, template, 'valid'))
+        np.testing.assert_allclose(fft_correlate(signal.real, template.real),
+                                   np.correlate(signal.real, template.real, 'valid'))
+
+    def test_find_preamble_offset_and_phase(self):
+        preamble = bpsk_modulate_baseband(BARKER_13, 4)
+        payload = qpsk_modulate_baseband(np.random.randint(0, 2, 200), 4)
+        frames = np.stack([np.concatenate((np.zeros(delay), preamble, payload, np.zeros(40 - delay)))
+                           for delay in (0, 13, 40)]) * np.exp(0.5j)
+        detection = find_preamble(frames, preamble, max_offset=40)
+        np.testing.assert_array_equal(detection['offset'], [0, 13, 40])
+        np.testing.assert_allclose(detection['phase'], 0.5)
+        np.testing.assert_allclose(align_payload(frames, preamble, len(payload), detection), np.tile(payload, (3, 1)))
+
+    def test_streaming_synchronizer_across_chunks(self):
+        preamble = bpsk_modulate(BARKER_13, 1000, 10000, 0.001)
+        rng = np.random.default_rng(1)
+        frames = [rng.integers(0, 2, 50) for _ in range(3)]
+        stream = np.concatenate([np.concatenate((np.zeros(delay), preamble, bpsk_modulate(bits, 1000, 10000, 0.001)))
+                                 for delay, bits in zip((25, 300, 7), frames)])
+        synchronizer = FrameSynchronizer(preamble, payload_length=500)
+        detections = []
+        for chunk in np.array_split(stream, 23):
+            detections += synchronizer.process(chunk)
+        detections += synchronizer.flush()
+        self.assertEqual([d['offset'] for d in detections], [25, 955, 1592])
+        for bits, detection in zip(frames, detections):
+            np.testing.assert_array_equal(bpsk_demodulate(detection['payload'], 1000, 10000, 0.001), bits)
+
+    def test_streaming_synchronizer_ignores_idle_noise(self):
+        preamble = bpsk_modulate_baseband(BARKER_13)
+        rng = np.random.default_rng(4)
+        noise = lambda n: 1e-4 * (rng.standard_normal(n) + 1j * rng.standard_normal(n))
+        synchronizer = FrameSynchronizer(preamble, payload_length=64)
+        self.assertEqual(synchronizer.process(noise(100000)) + synchronizer.flush(), [])
+        for trial in range(20):
+            frames = [rng.integers(0, 2, 64) for _ in range(4)]
+            gaps = rng.integers(20, 300, 4)
+            parts, offsets, position = [], [], 0
+            for gap, bits in zip(gaps, frames):
+                frame = np.concatenate((preamble, bpsk_modulate_baseband(bits)))
+                parts += [noise(gap), frame + 0.05 * noise(len(frame)) / 1e-4]
+                offsets.append(position + gap)
+                position += gap + len(frame)
+            stream = np.concatenate(parts + [noise(100)])
+            synchronizer.reset()
+            detections = []
+            for chunk in np.array_split(stream, np.sort(rng.integers(0, len(stream), 6))):
+                detections += synchronizer.process(chunk)
+            detections += synchronizer.flush()
+            self.assertEqual([d['offset'] for d in detections], offsets)
+            for bits, detection in zip(frames, detections):
+                np.testing.assert_array_equal(bpsk_demodulate_baseband(detection['payload']), bits)
+
+    def test_system_preamble_is_a_copy(self):
+        system = CommunicationSystem('bpsk', 10, 1000, 10000, 0.001)
+        system.preamble[0] = 0
+        self.assertEqual(BARKER_13[0], 1)
+        self.assertFalse(BARKER_13.flags.writeable)
+
+    def test_simulation_with_channel_delay(self):
+        for baseband in (False, True):
+            system = CommunicationSystem('qpsk', 10, 1000, 10000, 0.001, rng=np.random.default_rng(2),
+                                         baseband=baseband, max_delay=100)
+            self.assertEqual(system.run_batch(4, 200)['ber'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
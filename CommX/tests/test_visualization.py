@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import numpy as np
+from CommX.visualization import welch_psd, plot_time_domain, plot_frequency_domain, plot_constellation
+
+class TestVisualization(unittest.TestCase):
+    def test_import_does_not_load_matplotlib(self):
+        code = "import sys, CommX; sys.exit('matplotlib' in sys.modules)"
+        self.assertEqual(subprocess.call([sys.executable, '-c', code]), 0)
+
+    def test_welch_psd_preserves_power(self):
+        signal = np.random.default_rng(0).standard_normal(100000)
+        freq, psd = welch_psd(signal, 1000.0, 1024)
+        self.assertEqual(len(freq), 513)
+        self.assertAlmostEqual(np.sum(psd) * (freq[1] - freq[0]), np.mean(signal ** 2), delta=0.01)
+
+    def test_plots_save_to_file(self):
+        import matplotlib
+        matplotlib.use('Agg')
+        signal = np.random.default_rng(1).standard_normal(50000)
+        with tempfile.TemporaryDirectory() as directory:
+            for name, plot in [('time', lambda path: plot_time_domain(signal, 1000.0, save_path=path)),
+                               ('psd', lambda path: plot_frequency_domain(signal, 1000.0, save_path=path)),
+                               ('iq', lambda path: plot_constellation(signal + 1j * signal[::-1], save_path=path))]:
+                path = os.path.join(directory, name + '.png')
+                plot(path)
+                self.assertTrue(os.path.getsize(path) > 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,29 +1,92 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
-def plot_time_domain(signal: np.ndarray, sample_rate: float, title: str = 'Time Domain Signal') -> None:
-    t = np.arange(len(signal)) / sample_rate
-    plt.plot(t, signal)
-    plt.title(title)
-    plt.xlabel('Time (s)')
-    plt.ylabel('Amplitude')
-    plt.grid(True)
-    plt.show()
+def _pyplot():
+    # Imported on first use so simulation workers never pay for matplotlib.
+    import matplotlib.pyplot as plt
+    return plt
 
-def plot_frequency_domain(signal: np.ndarray, sample_rate: float, title: str = 'Frequency Domain Signal') -> None:
-    freq = np.fft.fftfreq(len(signal), 1 / sample_rate)
-    spectrum = np.fft.fft(signal)
-    plt.plot(freq, np.abs(spectrum))
-    plt.title(title)
-    plt.xlabel('Frequency (Hz)')
-    plt.ylabel('Magnitude')
-    plt.grid(True)
-    plt.show()
+def _finish(plt, fig, save_path: str) -> None:
+    if save_path is None:
+        plt.show()
+    else:
+        fig.savefig(save_path)
+        plt.close(fig)
 
-def plot_constellation(signal: np.ndarray, title: str = 'Constellation Diagram') -> None:
-    plt.scatter(np.real(signal), np.imag(signal))
-    plt.title(title)
-    plt.xlabel('In-phase')
-    plt.ylabel('Quadrature')
-    plt.grid(True)
-    plt.show()
\ No newline at end of file
+def _envelope(signal: np.ndarray, num_bins: int) -> tuple:
+    # Min/max of each bin of samples, so peaks survive decimation.
+    bin_size = -(-len(signal) // num_bins)
+    num_bins = -(-len(signal) // bin_size)
+    padded = np.empty(num_bins * bin_size, dtype=signal.dtype)
+    padded[:len(signal)] = signal
+    padded[len(signal):] = signal[-1]
+    bins = padded.reshape(num_bins, bin_size)
+    return np.arange(num_bins) * bin_size, bins.min(axis=1), bins.max(axis=1)
+
+def welch_psd(signal: np.ndarray, sample_rate: float, segment_length: int = 4096,
+              overlap: float = 0.5, batch_segments: int = 256) -> tuple:
+    signal = np.asarray(signal)
+    segment_length = min(segment_length, len(signal))
+    step = max(1, int(segment_length * (1 - overlap)))
+    window = np.hanning(segment_length) if segment_length > 1 else np.ones(1)
+    scale = 1 / (sample_rate * np.sum(window ** 2))
+    segments = np.lib.stride_tricks.sliding_window_view(signal, segment_length)[::step]
+    complex_input = np.iscomplexobj(signal)
+    psd = 0
+    # Segments are transformed a batch at a time to bound the temporary FFT buffers.
+    for start in range(0, len(segments), batch_segments):
+        batch = segments[start:start + batch_segments] * window
+        spectrum = np.fft.fft(batch, axis=-1) if complex_input else np.fft.rfft(batch, axis=-1)
+        psd = psd + np.sum(np.abs(spectrum) ** 2, axis=0)
+    psd = psd * scale / len(segments)
+    if complex_input:
+        return np.fft.fftshift(np.fft.fftfreq(segment_length, 1 / sample_rate)), np.fft.fftshift(psd)
+    if segment_length % 2 == 0:
+        psd[1:-1] *= 2
+    else:
+        psd[1:] *= 2
+    return np.fft.rfftfreq(segment_length, 1 / sample_rate), psd
+
+def plot_time_domain(signal: np.ndarray, sample_rate: float, title: str = 'Time Domain Signal',
+                     max_points: int = 10000, save_path: str = None) -> None:
+    plt = _pyplot()
+    signal = np.asarray(signal)
+    fig, ax = plt.subplots()
+    if len(signal) > max_points:
+        start, low, high = _envelope(signal, max_points // 2)
+        ax.fill_between(start / sample_rate, low, high, step='post', linewidth=0.5)
+    else:
+        ax.plot(np.arange(len(signal)) / sample_rate, signal)
+    ax.set_title(title)
+    ax.set_xlabel('Time (s)')
+    ax.set_ylabel('Amplitude')
+    ax.grid(True)
+    _finish(plt, fig, save_path)
+
+def plot_frequency_domain(signal: np.ndarray, sample_rate: float, title: str = 'Frequency Domain Signal',
+                          segment_length: int = 4096, save_path: str = None) -> None:
+    plt = _pyplot()
+    freq, psd = welch_psd(signal, sample_rate, segment_length)
+    fig, ax = plt.subplots()
+    ax.plot(freq, 10 * np.log10(psd + np.finfo(float).tiny))
+    ax.set_title(title)
+    ax.set_xlabel('Frequency (Hz)')
+    ax.set_ylabel('Power Spectral Density (dB/Hz)')
+    ax.grid(True)
+    _finish(plt, fig, save_path)
+
+def plot_constellation(signal: np.ndarray, title: str = 'Constellation Diagram', max_points: int = 20000,
+                       bins: int = 200, save_path: str = None) -> None:
+    plt = _pyplot()
+    signal = np.asarray(signal)
+    fig, ax = plt.subplots()
+    if signal.size > max_points:
+        counts, x_edges, y_edges = np.histogram2d(np.real(signal).ravel(), np.imag(signal).ravel(), bins=bins)
+        image = ax.pcolormesh(x_edges, y_edges, np.log1p(counts.T), shading='auto')
+        fig.colorbar(image, ax=ax, label='log(1 + count)')
+    else:
+        ax.scatter(np.real(signal), np.imag(signal))
+        ax.grid(True)
+    ax.set_title(title)
+    ax.set_xlabel('In-phase')
+    ax.set_ylabel('Quadrature')
+    _finish(plt, fig, save_path)
@@ -0,0 +1,151 @@
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from CommX.signals import random_binary_sequence, text_to_binary, sine_wave, square_wave, chirp
+from CommX.modulation import (bpsk_modulate, bpsk_demodulate, qpsk_modulate, qpsk_demodulate,
+                              bpsk_modulate_baseband, bpsk_demodulate_baseband,
+                              qpsk_modulate_baseband, qpsk_demodulate_baseband)
+from CommX.channels import awgn, block_fading, BlockFadingChannel, tapped_delay_line, multipath
+from CommX.error_correction import hamming_encode, hamming_decode
+
+CARRIER_FREQ = 1000.0
+BIT_DURATION = 0.001
+FADING_BLOCK = 1000
+DELAY_PROFILE = ([0, 3, 8, 20], [0, -3, -6, -10])
+
+def _best_time(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def _cases(frame_size: int, samples_per_bit: int, rng: np.random.Generator):
+    sample_rate = samples_per_bit / BIT_DURATION
+    bits = rng.integers(0, 2, frame_size)
+    text = ''.join(chr(c) for c in rng.integers(32, 127, frame_size // 8))
+    yield 'signals.random_binary_sequence', frame_size, frame_size, False, lambda: random_binary_sequence(frame_size, rng)
+    yield 'signals.text_to_binary', frame_size, frame_size, False, lambda: text_to_binary(text)
+    yield ('signals.sine_wave', 0, frame_size * samples_per_bit, True,
+           lambda: sine_wave(CARRIER_FREQ, frame_size * BIT_DURATION, sample_rate))
+    yield ('signals.square_wave', 0, frame_size * samples_per_bit, True,
+           lambda: square_wave(CARRIER_FREQ, frame_size * BIT_DURATION, sample_rate))
+    yield ('signals.chirp', 0, frame_size * samples_per_bit, True,
+           lambda: chirp(CARRIER_FREQ / 2, 2 * CARRIER_FREQ, frame_size * BIT_DURATION, sample_rate))
+    # Hamming(7, 4) needs whole 4-bit blocks and QPSK whole bit pairs, so
+    # those cases run on the frame trimmed to a multiple of the block size.
+    data = bits[:frame_size - frame_size % 4]
+    yield 'error_correction.hamming_encode', len(data), len(data), False, lambda: hamming_encode(data)
+    coded = hamming_encode(data)
+    yield 'error_correction.hamming_decode', len(data), len(coded), False, lambda: hamming_decode(coded)
+    for name, modulate, demodulate, bits_per_symbol in [
+            ('bpsk', bpsk_modulate, bpsk_demodulate, 1), ('qpsk', qpsk_modulate, qpsk_demodulate, 2)]:
+        data = bits[:frame_size - frame_size % bits_per_symbol]
+        samples = len(data) // bits_per_symbol * samples_per_bit
+        yield (f'modulation.{name}_modulate', len(data), samples, True,
+               lambda m=modulate, b=data: m(b, CARRIER_FREQ, sample_rate, BIT_DURATION))
+        signal = modulate(data, CARRIER_FREQ, sample_rate, BIT_DURATION)
+        yield (f'modulation.{name}_demodulate', len(data), samples, True,
+               lambda d=demodulate, s=signal: d(s, CARRIER_FREQ, sample_rate, BIT_DURATION))
+        if name == 'bpsk':
+            yield 'channels.awgn', frame_size, samples, True, lambda s=signal: awgn(s, 5.0, rng)
+            out = np.empty_like(signal)
+            yield 'channels.awgn_out', frame_size, samples, True, lambda s=signal: awgn(s, 5.0, rng, out=out)
+            yield ('channels.block_fading', frame_size, samples, True,
+                   lambda s=signal: block_fading(s, FADING_BLOCK, rng))
+            # Streaming fading, fed in chunks of about 64k samples.
+            yield ('channels.BlockFadingChannel', frame_size, samples, True,
+                   lambda s=signal: [BlockFadingChannel(FADING_BLOCK, rng).process(c)
+                                     for c in np.array_split(s, max(1, len(s) // 65536))])
+            taps = tapped_delay_line(*DELAY_PROFILE, rng)
+            yield 'channels.tapped_delay_line', 0, len(taps), True, lambda: tapped_delay_line(*DELAY_PROFILE, rng)
+            yield 'channels.multipath', frame_size, samples, True, lambda s=signal: multipath(s, taps)
+    for name, modulate, demodulate, bits_per_symbol in [
+            ('bpsk', bpsk_modulate_baseband, bpsk_demodulate_baseband, 1),
+            ('qpsk', qpsk_modulate_baseband, qpsk_demodulate_baseband, 2)]:
+        data = bits[:frame_size - frame_size % bits_per_symbol]
+        samples = len(data) // bits_per_symbol
+        yield f'modulation.{name}_modulate_baseband', len(data), samples, False, lambda m=modulate, b=data: m(b)
+        signal = modulate(data)
+        yield f'modulation.{name}_demodulate_baseband', len(data), samples, False, lambda d=demodulate, s=signal: d(s)
+
+def run(frame_sizes, samples_per_bit_values, repeat: int, seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+    results = []
+    for frame_size in frame_sizes:
+        for samples_per_bit in samples_per_bit_values:
+            for name, bits, samples, passband, func in _cases(frame_size, samples_per_bit, rng):
+                # Cases that do not depend on the sample rate are measured once per frame size.
+                if not passband and samples_per_bit != samples_per_bit_values[0]:
+                    continue
+                seconds = _best_time(func, repeat)
+                results.append({
+                    'name': name,
+                    'frame_size': frame_size,
+                    'samples_per_bit': samples_per_bit,
+                    'seconds': seconds,
+                    'bits_per_s': bits / seconds if bits else None,
+                    'samples_per_s': samples / seconds
+                })
+                print(f"{name:42s} frame={frame_size:<8d} spb={samples_per_bit:<5d} "
+                      f"{seconds * 1e3:10.3f} ms  {samples / seconds / 1e6:10.2f} Msamples/s")
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'repeat': repeat,
+            'seed': seed,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'results': results
+    }
+
+def compare(current: dict, baseline: dict, tolerance: float) -> int:
+    key = lambda r: (r['name'], r['frame_size'], r['samples_per_bit'])
+    reference = {key(r): r for r in baseline['results']}
+    regressions = 0
+    for result in current['results']:
+        old = reference.get(key(result))
+        if old is None:
+            continue
+        ratio = result['seconds'] / old['seconds']
+        flag = ''
+        if ratio > 1 + tolerance:
+            flag = '  REGRESSION'
+            regressions += 1
+        print(f"{result['name']:42s} frame={result['frame_size']:<8d} spb={result['samples_per_bit']:<5d} "
+              f"{ratio:6.2f}x baseline time{flag}")
+    return regressions
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Throughput benchmarks for the CommX signal chain.')
+    parser.add_argument('--frame-sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--samples-per-bit', type=int, nargs='+', default=[10, 100])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, help='write results to this JSON file')
+    parser.add_argument('--compare', type=Path, help='baseline JSON file to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='allowed slowdown relative to the baseline before flagging a regression')
+    args = parser.parse_args(argv)
+    current = run(args.frame_sizes, args.samples_per_bit, args.repeat, args.seed)
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2))
+    if args.compare:
+        regressions = compare(current, json.loads(args.compare.read_text()), args.tolerance)
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())